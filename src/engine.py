@@ -30,8 +30,7 @@ class Game:
             self.state.handle_events(events)
             self.state.update(self.delta_time)
 
-            # 3 draw the current state
-            self.screen.fill("black") # Clear screen before drawing
+            # 3 draw the current state (each state clears the screen itself)
             self.state.draw(self.screen)
             pygame.display.flip()
         pygame.quit()
\ No newline at end of file
@@ -3,6 +3,35 @@ Sprite factory module for creating procedural and asset-based sprites.
 """
 import pygame
 import os
+from collections import OrderedDict
+
+
+# Finished sprites keyed by (kind, creation arguments), shared by every entity
+# that asks for the same sprite so they are only drawn or loaded once.
+# Least recently used sprites are evicted beyond SPRITE_CACHE_SIZE entries.
+SPRITE_CACHE_SIZE = 256
+_sprite_cache = OrderedDict()
+
+
+def clear_sprite_cache():
+    """Drops all cached sprites so they are recreated on next use."""
+    _sprite_cache.clear()
+
+
+def _get_cached_sprite(key):
+    """Returns the cached sprite for key (marking it recently used), or None."""
+    sprite = _sprite_cache.get(key)
+    if sprite is not None:
+        _sprite_cache.move_to_end(key)
+    return sprite
+
+
+def _cache_sprite(key, sprite):
+    """Stores a sprite, evicting the least recently used ones past the size limit."""
+    _sprite_cache[key] = sprite
+    _sprite_cache.move_to_end(key)
+    while len(_sprite_cache) > SPRITE_CACHE_SIZE:
+        _sprite_cache.popitem(last=False)
 
 
 def create_procedural_fairy(size=(50, 50), color=(255, 200, 150), wing_color=(200, 230, 255)):
@@ -111,17 +140,24 @@ def create_fairy_sprite(name: str, size=(50, 50), color=(255, 200, 150), wing_co
         asset_dir: Directory containing fairy assets
     
     Returns:
-        pygame.Surface with the fairy sprite
+        pygame.Surface with the fairy sprite (shared; do not draw on it)
     """
+    # Procedural sprites don't depend on the name, so leave it out of the key
+    key = ("fairy", None if use_procedural else (name, asset_dir), tuple(size), tuple(color), tuple(wing_color))
+    sprite = _get_cached_sprite(key)
+    if sprite is not None:
+        return sprite
+    
     if use_procedural:
-        return create_procedural_fairy(size=size, color=color, wing_color=wing_color)
+        sprite = create_procedural_fairy(size=size, color=color, wing_color=wing_color)
     else:
-        asset_sprite = create_fairy_from_asset(name, size=size, asset_dir=asset_dir)
+        sprite = create_fairy_from_asset(name, size=size, asset_dir=asset_dir)
         # Fall back to procedural if asset not found
-        if asset_sprite is None:
+        if sprite is None:
             print(f"Falling back to procedural sprite for: {name}")
-            return create_procedural_fairy(size=size, color=color, wing_color=wing_color)
-        return asset_sprite
+            sprite = create_procedural_fairy(size=size, color=color, wing_color=wing_color)
+    _cache_sprite(key, sprite)
+    return sprite
 
 
 def create_procedural_unicorn(size=(60, 60), color=(240, 240, 255), mane_color=(255, 105, 180), horn_color=(255, 215, 0)):
@@ -294,14 +330,21 @@ def create_unicorn_sprite(name: str, size=(60, 60), color=(240, 240, 255), mane_
         asset_dir: Directory containing unicorn assets
     
     Returns:
-        pygame.Surface with the unicorn sprite
+        pygame.Surface with the unicorn sprite (shared; do not draw on it)
     """
+    # Procedural sprites don't depend on the name, so leave it out of the key
+    key = ("unicorn", None if use_procedural else (name, asset_dir), tuple(size), tuple(color), tuple(mane_color), tuple(horn_color))
+    sprite = _get_cached_sprite(key)
+    if sprite is not None:
+        return sprite
+    
     if use_procedural:
-        return create_procedural_unicorn(size=size, color=color, mane_color=mane_color, horn_color=horn_color)
+        sprite = create_procedural_unicorn(size=size, color=color, mane_color=mane_color, horn_color=horn_color)
     else:
-        asset_sprite = create_unicorn_from_asset(name, size=size, asset_dir=asset_dir)
+        sprite = create_unicorn_from_asset(name, size=size, asset_dir=asset_dir)
         # Fall back to procedural if asset not found
-        if asset_sprite is None:
+        if sprite is None:
             print(f"Falling back to procedural sprite for: {name}")
-            return create_procedural_unicorn(size=size, color=color, mane_color=mane_color, horn_color=horn_color)
-        return asset_sprite
+            sprite = create_procedural_unicorn(size=size, color=color, mane_color=mane_color, horn_color=horn_color)
+    _cache_sprite(key, sprite)
+    return sprite
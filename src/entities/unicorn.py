@@ -3,6 +3,27 @@ from .sprite_factory import create_unicorn_sprite
 import pygame
 
 
+# Shared stat letter font, dropped on pygame.quit() since the font dies with the font module
+_bar_font = None
+
+
+def _forget_bar_font():
+    global _bar_font
+    _bar_font = None
+
+
+def _get_bar_font() -> pygame.font.Font:
+    """Return the stat letter font, recreating it if pygame was re-initialized."""
+    global _bar_font
+    if _bar_font is None or not pygame.font.get_init():
+        if not pygame.font.get_init():
+            pygame.font.init()
+        _bar_font = pygame.font.Font(None, 12)
+        # Quit callbacks run once, so register again for every new font
+        pygame.register_quit(_forget_bar_font)
+    return _bar_font
+
+
 class Unicorn(BaseEntity):
     # Need decay rates per second (needs increase over time)
     NEED_DECAY_RATES = {
@@ -18,6 +39,8 @@ class Unicorn(BaseEntity):
     BAR_HEIGHT = 8
     BAR_SPACING = 2
     BAR_OFFSET_Y = -25  # Position bars above the sprite
+    BAR_LABEL_WIDTH = 12  # Space left of the bars for the stat letter
+    BAR_PADDING = 2  # Room above/below the bars so letters are not clipped
     
     # Colors for each need bar (stat letter, bar color)
     NEED_BAR_COLORS = {
@@ -60,6 +83,10 @@ class Unicorn(BaseEntity):
         self.food_need = 0    # Needs food
         self.sleep_need = 0   # Needs sleep/rest
         
+        # Cached need bar surface, rebuilt when the bar fill widths change
+        self._need_bar_surface = None
+        self._need_bar_key = None
+        
         # Initialize the sprite/rect from BaseEntity
         super().__init__(x, y, color="white", size=size)
         
@@ -141,50 +168,79 @@ class Unicorn(BaseEntity):
         """
         Draw need bars above the unicorn sprite.
         
+        The bars are pre-composited into a cached surface that is only rebuilt
+        when one of the bar fill widths (in pixels) changes.
+        
         Args:
             surface: The pygame surface to draw on
         """
-        # Font for the stat letter
-        font = pygame.font.Font(None, 12)
-        
-        # Get the sprite width
         sprite_width = self.rect.width
-        
-        # Starting Y position for bars (above the sprite)
-        start_y = self.rect.top + self.BAR_OFFSET_Y
-        
-        # Order: love, play, food, sleep
         needs = [
             ('love', self.love_need),
             ('play', self.play_need),
             ('food', self.food_need),
             ('sleep', self.sleep_need)
         ]
+        fill_widths = tuple(int(sprite_width * (need_value / self.MAX_NEED_VALUE)) for _, need_value in needs)
         
-        current_y = start_y
+        cache_key = (sprite_width, fill_widths)
+        if cache_key != self._need_bar_key:
+            self._need_bar_surface = self._render_need_bars(sprite_width, [name for name, _ in needs], fill_widths)
+            self._need_bar_key = cache_key
         
-        for need_name, need_value in needs:
+        # Cached surface origin sits left of the sprite (letters) and above the first bar
+        surface.blit(
+            self._need_bar_surface,
+            (self.rect.left - self.BAR_LABEL_WIDTH, self.rect.top + self.BAR_OFFSET_Y - self.BAR_PADDING)
+        )
+    
+    def _render_need_bars(self, sprite_width: int, need_names: list, fill_widths: tuple) -> pygame.Surface:
+        """
+        Render the need bars and their stat letters onto a new transparent surface.
+        
+        Args:
+            sprite_width: Width of the bars in pixels
+            need_names: Need names in display order
+            fill_widths: Filled width in pixels for each need
+        
+        Returns:
+            pygame.Surface with the bars drawn on it
+        """
+        # Font for the stat letter, shared by all unicorns
+        font = _get_bar_font()
+        
+        bars_height = len(need_names) * (self.BAR_HEIGHT + self.BAR_SPACING) - self.BAR_SPACING
+        bar_surface = pygame.Surface(
+            (self.BAR_LABEL_WIDTH + sprite_width, bars_height + 2 * self.BAR_PADDING),
+            pygame.SRCALPHA
+        )
+        
+        bar_left = self.BAR_LABEL_WIDTH
+        current_y = self.BAR_PADDING
+        
+        for need_name, fill_width in zip(need_names, fill_widths):
             color, letter = self.NEED_BAR_COLORS[need_name]
             
             # Draw the letter to the left of the bar
             letter_surface = font.render(letter, True, color)
             letter_rect = letter_surface.get_rect()
-            letter_rect.left = self.rect.left - 12
+            letter_rect.left = 0
             letter_rect.centery = current_y + self.BAR_HEIGHT // 2
-            surface.blit(letter_surface, letter_rect)
+            bar_surface.blit(letter_surface, letter_rect)
             
             # Background bar (black)
-            bg_rect = pygame.Rect(self.rect.left, current_y, sprite_width, self.BAR_HEIGHT)
-            pygame.draw.rect(surface, (0, 0, 0), bg_rect)
+            bg_rect = pygame.Rect(bar_left, current_y, sprite_width, self.BAR_HEIGHT)
+            pygame.draw.rect(bar_surface, (0, 0, 0), bg_rect)
             
             # Foreground bar (colored, fills based on need value)
-            fill_width = int(sprite_width * (need_value / self.MAX_NEED_VALUE))
             if fill_width > 0:
-                fill_rect = pygame.Rect(self.rect.left, current_y, fill_width, self.BAR_HEIGHT)
-                pygame.draw.rect(surface, color, fill_rect)
+                fill_rect = pygame.Rect(bar_left, current_y, fill_width, self.BAR_HEIGHT)
+                pygame.draw.rect(bar_surface, color, fill_rect)
             
             # Border (white outline)
-            pygame.draw.rect(surface, (255, 255, 255), bg_rect, 1)
+            pygame.draw.rect(bar_surface, (255, 255, 255), bg_rect, 1)
             
             # Move to next bar position
             current_y += self.BAR_HEIGHT + self.BAR_SPACING
+        
+        return bar_surface
@@ -0,0 +1,164 @@
+"""
+Layered renderer for compositing a scene from background, entity and HUD layers.
+"""
+import pygame
+
+
+def _new_surface(size, flags=0):
+    """
+    Creates a surface, converting it to the display format when a display exists.
+
+    Args:
+        size: Tuple (width, height) for the surface
+        flags: pygame surface flags (e.g. pygame.SRCALPHA)
+
+    Returns:
+        pygame.Surface ready for fast blitting
+    """
+    surface = pygame.Surface(size, flags)
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+
+
+class Layer:
+    """Base class for all render layers."""
+    def __init__(self):
+        self.visible = True
+
+    def invalidate(self): pass
+    def draw(self, surface): pass
+
+
+class BackgroundLayer(Layer):
+    """Static layer pre-composited into a single cached surface."""
+    def __init__(self, size: tuple, color="black"):
+        """
+        Initialize a BackgroundLayer.
+
+        Args:
+            size: Tuple (width, height) for the background
+            color: Fill color for the background
+        """
+        super().__init__()
+        self._size = size
+        self._color = color
+        self._decorations = []  # (image, position) pairs drawn over the fill
+        self._cache = None
+
+    def invalidate(self):
+        """Drop the cached surface so it is rebuilt on the next draw."""
+        self._cache = None
+
+    @property
+    def size(self) -> tuple:
+        return self._size
+
+    @size.setter
+    def size(self, size: tuple):
+        """Change the background size, rebuilding the cache only if it changed."""
+        if size != self._size:
+            self._size = size
+            self.invalidate()
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        """Change the fill color, rebuilding the cache only if it changed."""
+        if color != self._color:
+            self._color = color
+            self.invalidate()
+
+    def set_color(self, color):
+        """Change the fill color, rebuilding the cache only if it changed."""
+        self.color = color
+
+    @property
+    def decorations(self) -> tuple:
+        """Read-only view of the baked decorations; use add_decoration to change them."""
+        return tuple(self._decorations)
+
+    def add_decoration(self, image: pygame.Surface, position: tuple):
+        """Bake a static image into the background at the given position."""
+        self._decorations.append((image, position))
+        self.invalidate()
+
+    def draw(self, surface):
+        """Draw the background with a single blit of the cached surface.
+
+        Args:
+            surface: The pygame surface to draw to (typically the screen).
+        """
+        if self._cache is None:
+            self._cache = _new_surface(self._size)
+            self._cache.fill(self._color)
+            for image, position in self._decorations:
+                self._cache.blit(image, position)
+        surface.blit(self._cache, (0, 0))
+
+
+class EntityLayer(Layer):
+    """Layer that draws entity sprites sorted by y so lower entities appear in front."""
+    def __init__(self, entities=None):
+        super().__init__()
+        self.entities = list(entities) if entities else []
+
+    def add(self, entity):
+        self.entities.append(entity)
+
+    def remove(self, entity):
+        self.entities.remove(entity)
+
+    def draw(self, surface):
+        """Draw every entity sprite, back to front by the bottom of its rect.
+
+        Args:
+            surface: The pygame surface to draw to (typically the screen).
+        """
+        for entity in sorted(self.entities, key=lambda e: e.rect.bottom):
+            surface.blit(entity.image, entity.rect)
+
+
+class HudLayer(Layer):
+    """Layer that draws unicorn need bars above everything else."""
+    def __init__(self, unicorns=None):
+        super().__init__()
+        self.unicorns = list(unicorns) if unicorns else []
+
+    def add(self, unicorn):
+        self.unicorns.append(unicorn)
+
+    def remove(self, unicorn):
+        self.unicorns.remove(unicorn)
+
+    def draw(self, surface):
+        """Draw the need bars of every unicorn.
+
+        Args:
+            surface: The pygame surface to draw to (typically the screen).
+        """
+        for unicorn in self.unicorns:
+            unicorn.draw_need_bars(surface)
+
+
+class LayeredRenderer:
+    """Composites an ordered list of layers, bottom layer first."""
+    def __init__(self, layers=None):
+        self.layers = list(layers) if layers else []
+
+    def add_layer(self, layer: Layer):
+        self.layers.append(layer)
+        return layer
+
+    def draw(self, surface):
+        """Draw all visible layers in order.
+
+        Args:
+            surface: The pygame surface to draw to (typically the screen).
+        """
+        for layer in self.layers:
+            if layer.visible:
+                layer.draw(surface)
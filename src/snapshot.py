@@ -0,0 +1,232 @@
+"""
+Headless batch export of herd snapshots (unicorns with need bars, and fairies).
+
+Rosters are composited one at a time on the calling thread with the same
+layers PlayingState uses. A thread pool then PNG-encodes the finished
+images with zlib, which releases the GIL, and writes them to disk. Results
+are yielded as each write finishes.
+
+Rosters arrive with their Unicorn/Fairy objects already built, so the sprites
+drawn here are the ones made at construction time (shared through the
+bounded sprite factory cache); the export itself only reuses cached
+background layers across jobs.
+"""
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import pygame
+
+from .entities.playerData import PlayerData
+from .renderer import BackgroundLayer, EntityLayer, HudLayer, LayeredRenderer
+
+# Grid layout for a herd photo: each entity gets one cell, with room above
+# the sprite for the unicorn need bars and to the left for their letters.
+CELL_SIZE = (100, 110)
+CELL_PADDING = (20, 35)
+COLUMNS = 6
+
+IMAGE_FORMATS = ("png", "raw")
+
+
+@dataclass
+class SnapshotResult:
+    index: int  # Position of the roster in the input
+    path: str
+    size: tuple
+    error: Exception = None  # Set if writing this image failed
+
+
+def init_headless():
+    """
+    Initialize the pygame display and font modules without opening a window.
+
+    If the display is already running on a real video driver it is left
+    alone and no video mode is set, so surfaces keep their own pixel format.
+    """
+    if not pygame.display.get_init():
+        # Force the dummy driver for this init only, leaving the environment as it was
+        previous_driver = os.environ.get("SDL_VIDEODRIVER")
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        try:
+            pygame.display.init()
+        finally:
+            if previous_driver is None:
+                del os.environ["SDL_VIDEODRIVER"]
+            else:
+                os.environ["SDL_VIDEODRIVER"] = previous_driver
+    # Only display and font are needed; pygame.init() would also probe audio devices
+    if not pygame.font.get_init():
+        pygame.font.init()
+    if pygame.display.get_driver() == "dummy" and pygame.display.get_surface() is None:
+        # A (tiny) video mode lets sprites and caches use the display format
+        pygame.display.set_mode((1, 1))
+
+
+def render_roster(roster: PlayerData, background: BackgroundLayer = None, background_color="darkgreen") -> pygame.Surface:
+    """
+    Composite a roster's unicorns and fairies into a new surface.
+
+    Entities are laid out in a grid for the photo and moved back to their
+    original positions afterwards.
+
+    Args:
+        roster: The player data whose unicorns and fairies are drawn
+        background: Optional cached background layer to reuse (must match the canvas size)
+        background_color: Fill color used when no background layer is given
+
+    Returns:
+        pygame.Surface with the composited herd
+    """
+    entities = list(roster.unicorns) + list(roster.fairies)
+    size = snapshot_size(len(entities))
+    if background is None:
+        background = BackgroundLayer(size, color=background_color)
+
+    original_positions = [entity.rect.topleft for entity in entities]
+    try:
+        for i, entity in enumerate(entities):
+            row, column = divmod(i, COLUMNS)
+            entity.rect.topleft = (
+                column * CELL_SIZE[0] + CELL_PADDING[0],
+                row * CELL_SIZE[1] + CELL_PADDING[1]
+            )
+
+        surface = pygame.Surface(size)
+        renderer = LayeredRenderer([
+            background,
+            EntityLayer(entities),
+            HudLayer(roster.unicorns),
+        ])
+        renderer.draw(surface)
+    finally:
+        for entity, position in zip(entities, original_positions):
+            entity.rect.topleft = position
+
+    return surface
+
+
+def snapshot_size(entity_count: int) -> tuple:
+    """Canvas size for a herd photo with the given number of entities."""
+    rows = max(1, -(-entity_count // COLUMNS))
+    columns = max(1, min(entity_count, COLUMNS))
+    return (columns * CELL_SIZE[0], rows * CELL_SIZE[1])
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Frame one PNG chunk: length, tag, data and CRC."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def _encode_png(pixels: bytes, size: tuple) -> bytes:
+    """
+    Encode 8-bit RGB pixels as a PNG file.
+
+    pygame.image.save holds the GIL while it encodes, but zlib releases it
+    while compressing, so this lets worker threads encode in parallel.
+
+    Args:
+        pixels: Raw RGB bytes as returned by pygame.image.tobytes(surface, "RGB")
+        size: Tuple (width, height) of the image
+
+    Returns:
+        The PNG file contents
+    """
+    width, height = size
+    stride = width * 3
+    # Every scanline starts with filter type 0 (none)
+    scanlines = b"".join(b"\x00" + pixels[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8-bit RGB, no interlace
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(scanlines, 6))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def _write_image(pixels: bytes, size: tuple, path: str, image_format: str) -> str:
+    """Encode raw pixels and write them to disk (runs on a worker thread)."""
+    data = _encode_png(pixels, size) if image_format == "png" else pixels
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def export_snapshots(rosters: Iterable[PlayerData], output_dir: str, image_format: str = "png", workers: int = 4, max_pending: int = None, prefix: str = "herd", background_color="darkgreen") -> Iterator[SnapshotResult]:
+    """
+    Render and write a snapshot for every roster, yielding results as they finish.
+
+    Rosters are consumed lazily and at most max_pending images are held in
+    memory at once. Results may arrive out of input order; use
+    SnapshotResult.index to match them up. A failed write does not stop the
+    export; its result carries the exception in SnapshotResult.error.
+
+    Args:
+        rosters: Iterable of PlayerData to render
+        output_dir: Directory the images are written to (created if missing)
+        image_format: "png", or "raw" for unencoded RGBA bytes
+        workers: Number of threads encoding and writing images
+        max_pending: Maximum images rendered but not yet written (defaults to 2 * workers)
+        prefix: Filename prefix, files are named "<prefix>_<index>.<format>"
+        background_color: Fill color for the photo background
+
+    Returns:
+        Iterator yielding a SnapshotResult for each roster
+
+    Raises:
+        ValueError: If image_format, workers or max_pending is invalid
+    """
+    # Validate here rather than in the generator so bad arguments fail on the call
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format '{image_format}', expected one of {IMAGE_FORMATS}")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if max_pending is None:
+        max_pending = 2 * workers
+    if max_pending < 1:
+        raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+
+    return _export_snapshots(rosters, output_dir, image_format, workers, max_pending, prefix, background_color)
+
+
+def _export_snapshots(rosters: Iterable[PlayerData], output_dir: str, image_format: str, workers: int, max_pending: int, prefix: str, background_color) -> Iterator[SnapshotResult]:
+    """Generator behind export_snapshots, run with already validated arguments."""
+    init_headless()
+    os.makedirs(output_dir, exist_ok=True)
+
+    # One cached background per canvas size, shared across jobs
+    backgrounds = {}
+    pending = {}
+
+    def finished(futures):
+        for future in futures:
+            index, path, size = pending.pop(future)
+            # Report a failed write on its own result so the rest of the batch still comes through
+            yield SnapshotResult(index=index, path=path, size=size, error=future.exception())
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, roster in enumerate(rosters):
+            # Stream out whatever has already been written, and only block when the buffer is full
+            yield from finished([future for future in pending if future.done()])
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
+
+            size = snapshot_size(len(roster.unicorns) + len(roster.fairies))
+            if size not in backgrounds:
+                backgrounds[size] = BackgroundLayer(size, color=background_color)
+            surface = render_roster(roster, background=backgrounds[size])
+            # Hand the workers plain bytes: no pygame calls off the main thread
+            pixels = pygame.image.tobytes(surface, "RGB" if image_format == "png" else "RGBA")
+
+            path = os.path.join(output_dir, f"{prefix}_{index:05d}.{image_format}")
+            future = pool.submit(_write_image, pixels, size, path, image_format)
+            pending[future] = (index, path, size)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finished(done)
@@ -2,6 +2,8 @@ import pygame
 
 from .entities.fairy import Fairy
 from .entities.unicorn import Unicorn
+from .renderer import LayeredRenderer, BackgroundLayer, EntityLayer, HudLayer
+from .settings import WIDTH, HEIGHT
 
 class State:
     """Base class for all game states."""
@@ -10,7 +12,8 @@ class State:
 
     def handle_events(self, events): pass
     def update(self, delta_time: float = 0): pass
-    def draw(self, screen): pass
+    def draw(self, screen):
+        screen.fill("black")
 
 class MenuState(State):
     def handle_events(self, events):
@@ -29,13 +32,17 @@ class PlayingState(State):
         self.unicorn = Unicorn("Sparkle", "A magical pink unicorn", 50, x=200, y=200)
         # create a fairy and draw on screen
         self.fairy = Fairy("Fairy", "Description", 10, x=100, y=100)
+        
+        # Background is cached and only rebuilt when it changes; entities are y-sorted
+        self.renderer = LayeredRenderer([
+            BackgroundLayer((WIDTH, HEIGHT), color="darkgreen"), # Placeholder for Level 1
+            EntityLayer([self.fairy, self.unicorn]),
+            HudLayer([self.unicorn]),
+        ])
     
     def update(self, delta_time: float = 0):
         # Update unicorn needs
         self.unicorn.update(delta_time)
 
     def draw(self, screen):
-        screen.fill("darkgreen") # Placeholder for Level 1
-        self.fairy.draw(screen)
-        # draw the unicorn (created once in __init__)
-        self.unicorn.draw(screen)
\ No newline at end of file
+        self.renderer.draw(screen)
\ No newline at end of file